@@ -98,7 +98,7 @@ TAGS_METADATA = [
     },
 ]
 
-configure_logging()
+configure_logging(use_queue=True)
 logging.info("Logging enabled")
 logging.debug("Debugging output enabled")
 
@@ -123,6 +123,11 @@ app.add_middleware(
 )
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    await oqt.close_connections()
+
+
 class CustomJSONResponse(JSONResponse):
     def render(self, content):
         return json.dumps(content, default=json_serialize).encode()
@@ -31,6 +31,9 @@ TopicEnum = Enum("TopicEnum", {name: name for name in get_topic_keys()})
 DatasetEnum = Enum("DatasetNames", {name: name for name in get_dataset_names()})
 FidFieldEnum = Enum("FidFieldEnum", {name: name for name in get_fid_fields()})
 
+# Valid indicators of each topic. Used to validate the indicator topic combination.
+VALID_INDICATORS = {t: frozenset(get_valid_indicators(t)) for t in get_topic_keys()}
+
 
 class BaseIndicator(BaseModel):
     name: IndicatorEnum = pydantic.Field(
@@ -115,10 +118,11 @@ class BaseBpolys(BaseModel):
     @classmethod
     def validate_bpolys(cls, value) -> dict:
         """Validate GeoJSON."""
-        # Load and validate GeoJSON
-        for _ in loads_geojson(value):
-            # Check if exceptions are raised by `loads_geojson`
-            pass
+        if isinstance(value, (Feature, FeatureCollection)) and value.is_valid:
+            return value
+        # Load and validate GeoJSON. Validation happens before the first feature is
+        # yielded. Check if exceptions are raised by `loads_geojson`.
+        next(loads_geojson(value), None)
         return value
 
 
@@ -134,12 +138,13 @@ class IndicatorBpolys(BaseIndicator, BaseTopicName, BaseBpolys):
     @pydantic.root_validator
     @classmethod
     def validate_indicator_topic(cls, values):
-        try:
-            indicator = values["name"].value
-            topic = values["topic_key"].value
-        except KeyError:
+        name = values.get("name")
+        topic_key = values.get("topic_key")
+        if name is None or topic_key is None:
             raise ValueError("An issue with the topic or indicator keys occurred.")
-        if indicator not in get_valid_indicators(topic):
+        indicator = name.value
+        topic = topic_key.value
+        if indicator not in VALID_INDICATORS[topic]:
             raise ValueError(
                 "Indicator topic combination is invalid: "
                 + str(indicator)
@@ -154,12 +159,13 @@ class IndicatorDatabase(BaseIndicator, BaseTopicName, BaseDatabase):
     @pydantic.root_validator
     @classmethod
     def validate_indicator_topic(cls, values):
-        try:
-            indicator = values["name"].value
-            topic = values["topic_key"].value
-        except KeyError:
+        name = values.get("name")
+        topic_key = values.get("topic_key")
+        if name is None or topic_key is None:
             raise ValueError("An issue with the topic or indicator key occurred.")
-        if indicator not in get_valid_indicators(topic):
+        indicator = name.value
+        topic = topic_key.value
+        if indicator not in VALID_INDICATORS[topic]:
             raise ValueError(
                 "Indicator topic combination is invalid: "
                 + str(indicator)
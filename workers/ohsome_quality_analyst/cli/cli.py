@@ -1,6 +1,8 @@
 import asyncio
 import json
 import logging
+from functools import lru_cache
+from typing import Coroutine
 
 import click
 import geojson
@@ -14,7 +16,11 @@ from ohsome_quality_analyst.api.request_models import (
     ReportDatabase,
 )
 from ohsome_quality_analyst.cli import options
-from ohsome_quality_analyst.config import configure_logging, get_config_value
+from ohsome_quality_analyst.config import (
+    SafeDumper,
+    configure_logging,
+    get_config_value,
+)
 from ohsome_quality_analyst.definitions import get_topic_keys, load_metadata
 from ohsome_quality_analyst.geodatabase import client as db_client
 from ohsome_quality_analyst.utils.helper import json_serialize, write_geojson
@@ -29,6 +35,18 @@ def cli_option(option):
     return _cli_option
 
 
+def run(coroutine: Coroutine):
+    """Run coroutine in a new event loop and close open connections afterwards."""
+
+    async def _run():
+        try:
+            return await coroutine
+        finally:
+            await oqt.close_connections()
+
+    return asyncio.run(_run())
+
+
 @click.group()
 @click.version_option()
 @click.option("--quiet", "-q", is_flag=True, help="Disable logging.")
@@ -39,20 +57,31 @@ def cli(quiet: bool):
         logging.debug("Debugging output enabled")
 
 
+@lru_cache(maxsize=2)
+def dump_metadata(module_name: str) -> str:
+    """Dump metadata of all indicators or reports as YAML string.
+
+    Metadata is static. The dumped string is cached to avoid reading and serializing
+    the same YAML files on every call.
+    """
+    return yaml.dump(load_metadata(module_name), Dumper=SafeDumper, default_style="|")
+
+
+def echo_metadata(module_name: str) -> None:
+    """Write metadata of all indicators or reports as YAML to stdout."""
+    click.echo(dump_metadata(module_name), nl=False)
+
+
 @cli.command("list-indicators")
 def list_indicators():
     """List available indicators and their metadata."""
-    metadata = load_metadata("indicators")
-    metadata = yaml.dump(metadata, default_style="|")
-    click.echo(metadata)
+    echo_metadata("indicators")
 
 
 @cli.command("list-reports")
 def list_reports():
     """List available reports and their metadata."""
-    metadata = load_metadata("reports")
-    metadata = yaml.dump(metadata, default_style="|")
-    click.echo(metadata)
+    echo_metadata("reports")
 
 
 @cli.command("list-datasets")
@@ -73,7 +102,7 @@ def list_fid_fields():
 @cli.command("list-regions")
 def get_available_regions():
     """List available regions."""
-    regions = asyncio.run(db_client.get_regions())
+    regions = run(db_client.get_regions())
     format_row = "{:>4}{:>20}"
     click.echo(format_row.format("fid", "name"))
     click.echo(format_row.format("---", "-" * 19))
@@ -112,12 +141,14 @@ def create_indicator(
         )
         click.confirm("Do you want to continue?", abort=True)
     if infile is not None:
-        with open(infile, "r") as file:
+        with open(infile, "rb") as file:
             bpolys = json.load(file)
         parameters = IndicatorBpolys(
             name=indicator_name,
             topic=topic_key,
             bpolys=bpolys,
+            include_svg=True,
+            include_html=True,
         )
     else:
         parameters = IndicatorDatabase(
@@ -127,7 +158,7 @@ def create_indicator(
             feature_id=feature_id,
             fid_field=fid_field,
         )
-    geojson_object = asyncio.run(oqt.create_indicator_as_geojson(parameters, force))
+    geojson_object = run(oqt.create_indicator_as_geojson(parameters, force))
     if outfile:
         write_geojson(outfile, geojson_object)
     click.echo(geojson.dumps(geojson_object, default=json_serialize, allow_nan=True))
@@ -162,9 +193,14 @@ def create_report(
         )
         click.confirm("Do you want to continue?", abort=True)
     if infile is not None:
-        with open(infile, "r") as file:
+        with open(infile, "rb") as file:
             bpolys = json.load(file)
-        parameters = ReportBpolys(name=report_name, bpolys=bpolys)
+        parameters = ReportBpolys(
+            name=report_name,
+            bpolys=bpolys,
+            include_svg=True,
+            include_html=True,
+        )
     else:
         parameters = ReportDatabase(
             name=report_name,
@@ -172,7 +208,7 @@ def create_report(
             feature_id=feature_id,
             fid_field=fid_field,
         )
-    geojson_object = asyncio.run(oqt.create_report_as_geojson(parameters, force))
+    geojson_object = run(oqt.create_report_as_geojson(parameters, force))
     if outfile:
         write_geojson(outfile, geojson_object)
     click.echo(geojson.dumps(geojson_object, default=json_serialize, allow_nan=True))
@@ -235,7 +271,7 @@ def create_all_indicators(
             + "database."
         )
     click.confirm("Do you want to continue?", abort=True)
-    asyncio.run(
+    run(
         oqt.create_all_indicators(
             dataset_name,
             indicator_name=indicator_name,
@@ -1,11 +1,14 @@
 """Load configuration from environment variables or configuration file on disk."""
 
+import atexit
 import logging
 import logging.config
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from types import MappingProxyType
-from typing import Union
+from typing import Optional, Union
 
 import rpy2.rinterface_lib.callbacks
 import yaml
@@ -13,6 +16,13 @@ import yaml
 from ohsome_quality_analyst import __version__ as oqt_version
 from ohsome_quality_analyst.utils.helper import get_project_root
 
+# Use the LibYAML based loader and dumper if PyYAML has been built with LibYAML bindings
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Listener which writes log records to the configured handlers in a separate thread
+_log_listener: Optional[QueueListener] = None
+
 
 def get_config_path() -> str:
     """Get configuration file path
@@ -35,6 +45,8 @@ def load_config_default() -> dict:
         "log_level": "INFO",
         "ohsome_api": "https://api.ohsome.org/v1/",
         "concurrent_computations": 4,
+        "results_cache_size": 256,
+        "results_cache_ttl": 60,
         "user_agent": "ohsome-quality-analyst/{}".format(oqt_version),
         "datasets": {
             "regions": {
@@ -49,7 +61,7 @@ def load_config_from_file(path: str) -> dict:
     """Load configuration from file on disk."""
     if os.path.isfile(path):
         with open(path, "r") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
     else:
         return {}
 
@@ -66,6 +78,8 @@ def load_config_from_env() -> dict:
         "geom_size_limit": os.getenv("OQT_GEOM_SIZE_LIMIT"),
         "ohsome_api": os.getenv("OQT_OHSOME_API"),
         "concurrent_computations": os.getenv("OQT_CONCURRENT_COMPUTATIONS"),
+        "results_cache_size": os.getenv("OQT_RESULTS_CACHE_SIZE"),
+        "results_cache_ttl": os.getenv("OQT_RESULTS_CACHE_TTL"),
         "user_agent": os.getenv("OQT_USER_AGENT"),
     }
     return {k: v for k, v in cfg.items() if v is not None}
@@ -107,7 +121,7 @@ def load_logging_config():
     )
     level = get_log_level()
     with open(path, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
     config["root"]["level"] = getattr(logging, level.upper())
     return config
 
@@ -120,8 +134,14 @@ def get_log_level():
     return os.getenv("OQT_LOG_LEVEL", default=default_level)
 
 
-def configure_logging() -> None:
-    """Configure logging level and format."""
+def configure_logging(use_queue: bool = False) -> None:
+    """Configure logging level and format.
+
+    Args:
+        use_queue: Write log records in a separate thread (see `start_log_listener`).
+            Intended for the API. The CLI writes its output to the same stream and
+            needs log records to be written in order.
+    """
 
     class RPY2LoggingFilter(logging.Filter):  # Sensitive
         def filter(self, record):
@@ -132,4 +152,30 @@ def configure_logging() -> None:
     rpy2.rinterface_lib.callbacks.logger.addFilter(RPY2LoggingFilter())
     # Avoid a huge amount of DEBUG logs from matplotlib font_manager.py
     logging.getLogger("matplotlib.font_manager").setLevel(logging.INFO)
+    stop_log_listener()
     logging.config.dictConfig(load_logging_config())
+    if use_queue:
+        start_log_listener()
+
+
+def start_log_listener() -> None:
+    """Move handlers of the root logger behind a queue.
+
+    Logging calls only put records into the queue. The configured handlers are called
+    by a listener in a separate thread. This way logging does not block on I/O.
+    """
+    global _log_listener
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    _log_listener.start()
+
+
+@atexit.register
+def stop_log_listener() -> None:
+    """Stop the listener after it has processed all queued log records."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
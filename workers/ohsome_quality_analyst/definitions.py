@@ -3,12 +3,14 @@ import glob
 import logging
 import os
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations
 from types import MappingProxyType
-from typing import Dict, List, Literal, Optional
+from typing import Dict, List, Literal, NamedTuple, Optional, Tuple
 
 import yaml
 
-from ohsome_quality_analyst.config import get_config_value
+from ohsome_quality_analyst.config import SafeLoader, get_config_value
 from ohsome_quality_analyst.topics.models import TopicDefinition
 from ohsome_quality_analyst.utils.exceptions import RasterDatasetUndefinedError
 from ohsome_quality_analyst.utils.helper import (
@@ -18,7 +20,7 @@ from ohsome_quality_analyst.utils.helper import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RasterDataset:
     """Raster datasets available on disk.
 
@@ -61,6 +63,8 @@ RASTER_DATASETS = (
     ),
 )
 
+RASTER_DATASETS_BY_NAME = MappingProxyType({r.name: r for r in RASTER_DATASETS})
+
 ATTRIBUTION_TEXTS = MappingProxyType(
     {
         "OSM": "© OpenStreetMap contributors",
@@ -69,11 +73,73 @@ ATTRIBUTION_TEXTS = MappingProxyType(
     }
 )
 
+# Attribution texts of all combinations of data keys. Separated by semicolons.
+ATTRIBUTIONS = MappingProxyType(
+    {
+        frozenset(keys): "; ".join(ATTRIBUTION_TEXTS[k] for k in keys)
+        for n in range(len(ATTRIBUTION_TEXTS) + 1)
+        for keys in combinations(ATTRIBUTION_TEXTS, n)
+    }
+)
+
 ATTRIBUTION_URL = (
     "https://github.com/GIScience/ohsome-quality-analyst/blob/main/data/"
     + "COPYRIGHTS.md"
 )
 
+# Parsed content and modification time of YAML files keyed by file path
+_YAML_CACHE: Dict[str, Tuple[int, Dict]] = {}
+
+# Paths of metadata files of indicators and reports keyed by module name
+_METADATA_FILES: Dict[str, List[str]] = {}
+
+
+class _TopicDefinitions(NamedTuple):
+    """Topic definitions built from the parsed YAML content.
+
+    Args:
+        raw: Parsed content of the YAML file
+        topics: Topic definitions by topic key
+        by_indicator: Keys of valid topics by indicator name
+    """
+
+    raw: Dict
+    topics: Dict[str, TopicDefinition]
+    by_indicator: Dict[str, Tuple[str, ...]]
+
+
+# Topic definitions built from the last parsed content of the YAML file
+_topic_definitions: Optional[_TopicDefinitions] = None
+
+
+def load_yaml(file: str) -> Dict:
+    """Read YAML file.
+
+    The parsed content is cached and only read again if the file has been modified.
+    """
+    mtime = os.stat(file).st_mtime_ns
+    cached = _YAML_CACHE.get(file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    # Read bytes in one go and let the YAML parser detect the encoding
+    with open(file, "rb") as f:
+        content = yaml.load(f.read(), Loader=SafeLoader)
+    _YAML_CACHE[file] = (mtime, content)
+    return content
+
+
+def get_metadata_files(module_name: str) -> List[str]:
+    """Get paths of the metadata files of all indicators or reports.
+
+    Indicators and reports do not change at runtime. Therefore, the directory is only
+    searched once.
+    """
+    if module_name not in _METADATA_FILES:
+        directory = get_module_dir("ohsome_quality_analyst.{0}".format(module_name))
+        files = glob.glob(directory + "/**/metadata.yaml", recursive=True)
+        _METADATA_FILES[module_name] = files
+    return _METADATA_FILES[module_name]
+
 
 def load_metadata(module_name: str) -> Dict:
     """Read metadata of all indicators or reports from YAML files.
@@ -89,12 +155,9 @@ def load_metadata(module_name: str) -> Dict:
     if module_name != "indicators" and module_name != "reports":
         raise ValueError("module name value can only be 'indicators' or 'reports'.")
 
-    directory = get_module_dir("ohsome_quality_analyst.{0}".format(module_name))
-    files = glob.glob(directory + "/**/metadata.yaml", recursive=True)
     metadata = {}
-    for file in files:
-        with open(file, "r") as f:
-            metadata = {**metadata, **yaml.safe_load(f)}  # Merge dicts
+    for file in get_metadata_files(module_name):
+        metadata.update(load_yaml(file))  # Merge dicts
     return metadata
 
 
@@ -114,40 +177,52 @@ def get_metadata(
     if module_name not in ("indicators", "reports"):
         raise ValueError("module name value can only be 'indicators' or 'reports'.")
 
-    metadata = load_metadata(module_name)
-    try:
-        return metadata[camel_to_hyphen(class_name)]
-    except KeyError:
-        logging.error(
-            "Invalid {0} class name. Valid {0} class names are: ".format(
-                module_name[:-1]
-            )
-            + str(metadata.keys())
-        )
-        raise
+    key = camel_to_hyphen(class_name)
+    # Look up the key in each metadata file instead of merging all files first.
+    # Files are searched in reverse order since later files take precedence on merge.
+    for file in reversed(get_metadata_files(module_name)):
+        metadata = load_yaml(file)
+        if key in metadata:
+            return metadata[key]
+    logging.error(
+        "Invalid {0} class name. Valid {0} class names are: ".format(module_name[:-1])
+        + str(load_metadata(module_name).keys())
+    )
+    raise KeyError(key)
 
 
 def load_topic_definitions() -> Dict[str, TopicDefinition]:
     """Read ohsome API parameters of all topic from YAML file.
 
+    Topic definitions are cached until the YAML file is modified.
+
     Returns:
         A dict with all topics included.
     """
+    return dict(_load_topic_definitions().topics)
+
+
+def _load_topic_definitions() -> _TopicDefinitions:
+    """Read topic definitions and build an index of valid topics by indicator."""
+    global _topic_definitions
     directory = get_module_dir("ohsome_quality_analyst.topics")
     file = os.path.join(directory, "presets.yaml")
-    with open(file, "r") as f:
-        raw = yaml.safe_load(f)
-    topics = {}
-    for k, v in raw.items():
-        v["filter"] = v.pop("filter")
-        v["key"] = k
-        topics[k] = TopicDefinition(**v)
-    return topics
+    raw = load_yaml(file)
+    # Only build topic definitions again if the YAML file has been parsed again
+    if _topic_definitions is None or _topic_definitions.raw is not raw:
+        topics = {k: TopicDefinition(key=k, **v) for k, v in raw.items()}
+        by_indicator = {}
+        for key, topic in topics.items():
+            for indicator in topic.indicators:
+                by_indicator.setdefault(indicator, []).append(key)
+        by_indicator = {k: tuple(v) for k, v in by_indicator.items()}
+        _topic_definitions = _TopicDefinitions(raw, topics, by_indicator)
+    return _topic_definitions
 
 
 def get_topic_definition(topic_key: str) -> TopicDefinition:
     """Get ohsome API parameters of a single topic based on topic key."""
-    topics = load_topic_definitions()
+    topics = _load_topic_definitions().topics
     try:
         return topics[topic_key]
     except KeyError as error:
@@ -181,15 +256,17 @@ def get_report_names() -> List[str]:
 
 
 def get_topic_keys() -> List[str]:
-    return [str(t) for t in load_topic_definitions().keys()]
+    return [str(t) for t in _load_topic_definitions().topics.keys()]
 
 
+@lru_cache(maxsize=1)
 def get_dataset_names() -> List[str]:
+    # Cached since request models are built from the configuration once at import
     return list(get_config_value("datasets").keys())
 
 
 def get_raster_dataset_names() -> List[str]:
-    return [r.name for r in RASTER_DATASETS]
+    return list(RASTER_DATASETS_BY_NAME.keys())
 
 
 def get_raster_dataset(name: str) -> RasterDataset:
@@ -205,29 +282,29 @@ def get_raster_dataset(name: str) -> RasterDataset:
         RasterDatasetUndefinedError: If no matching `RasterDataset` class is found.
     """
     try:
-        return next(filter(lambda r: r.name == name, RASTER_DATASETS))
-    except StopIteration as e:
+        return RASTER_DATASETS_BY_NAME[name]
+    except KeyError as e:
         raise RasterDatasetUndefinedError(name) from e
 
 
+@lru_cache(maxsize=1)
 def get_fid_fields() -> List[str]:
+    # Cached since request models are built from the configuration once at import
     return flatten_sequence(get_config_value("datasets").values())
 
 
 def get_attribution(data_keys: list) -> str:
     """Return attribution text. Individual attributions are separated by semicolons."""
-    assert set(data_keys) <= set(("OSM", "GHSL", "VNL"))
-    filtered = dict(filter(lambda d: d[0] in data_keys, ATTRIBUTION_TEXTS.items()))
-    return "; ".join([str(v) for v in filtered.values()])
+    keys = frozenset(data_keys)
+    assert keys in ATTRIBUTIONS
+    return ATTRIBUTIONS[keys]
 
 
 def get_valid_topics(indicator_name: str) -> tuple:
     """Get valid Indicator/Topic combination of an Indicator."""
-    td = load_topic_definitions()
-    return tuple(topic for topic in td if indicator_name in td[topic].indicators)
+    return _load_topic_definitions().by_indicator.get(indicator_name, ())
 
 
 def get_valid_indicators(topic_key: str) -> tuple:
     """Get valid Indicator/Topic combination of a Topic."""
-    td = load_topic_definitions()
-    return tuple(td[topic_key].indicators)
+    return tuple(_load_topic_definitions().topics[topic_key].indicators)
@@ -14,11 +14,16 @@ On preventing SQL injections:
     please make sure no SQL injection attack is possible.
 """
 
+import asyncio
+import copy
 import json
 import logging
 import os
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import List, Union
+from functools import lru_cache
+from typing import Dict, List, Union
 
 import asyncpg
 import geojson
@@ -32,22 +37,74 @@ from ohsome_quality_analyst.utils.helper import json_serialize
 
 WORKING_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# One connection pool per event loop. Values are tasks creating the pool.
+_POOLS: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+
+# Least recently used cache of loaded indicator results. Keys are tuples of indicator
+# name, topic name, dataset and feature id. Values are tuples of the time of loading
+# and the result. Results can be updated by other processes (e.g. by the CLI), which
+# is why entries expire (config values `results_cache_size` and `results_cache_ttl`).
+_RESULTS_CACHE: OrderedDict = OrderedDict()
+
+# Data types of dataset columns keyed by table and column name
+_COLUMN_TYPES: Dict[tuple, str] = {}
+
 
 @asynccontextmanager
 async def get_connection():
-    # DNS in libpq connection URI format
-    dns = "postgres://{user}:{password}@{host}:{port}/{database}".format(
-        host=get_config_value("postgres_host"),
-        port=get_config_value("postgres_port"),
-        database=get_config_value("postgres_db"),
-        user=get_config_value("postgres_user"),
-        password=get_config_value("postgres_password"),
-    )
-    conn = await asyncpg.connect(dns)
-    try:
+    """Acquire a connection from the connection pool of the running event loop."""
+    pool = await get_pool()
+    async with pool.acquire() as conn:
         yield conn
-    finally:
-        await conn.close()
+
+
+async def get_pool() -> asyncpg.Pool:
+    """Get the connection pool of the running event loop.
+
+    Connections are reused by all queries within the same event loop instead of
+    establishing a new connection for each query.
+    """
+    # Drop pools of closed event loops. Those can not be used or closed gracefully
+    # anymore. Terminate them to close their connections.
+    for loop in [loop for loop in _POOLS if loop.is_closed()]:
+        task = _POOLS.pop(loop)
+        if task.done() and not task.cancelled() and task.exception() is None:
+            task.result().terminate()
+    loop = asyncio.get_running_loop()
+    if loop not in _POOLS:
+        # DNS in libpq connection URI format
+        dns = "postgres://{user}:{password}@{host}:{port}/{database}".format(
+            host=get_config_value("postgres_host"),
+            port=get_config_value("postgres_port"),
+            database=get_config_value("postgres_db"),
+            user=get_config_value("postgres_user"),
+            password=get_config_value("postgres_password"),
+        )
+        # Pool is created by a task which can be awaited by concurrent callers
+        _POOLS[loop] = asyncio.ensure_future(asyncpg.create_pool(dns, min_size=0))
+    try:
+        return await asyncio.shield(_POOLS[loop])
+    except Exception:
+        _POOLS.pop(loop, None)
+        raise
+
+
+async def close_pool() -> None:
+    """Close the connection pool of the running event loop."""
+    task = _POOLS.pop(asyncio.get_running_loop(), None)
+    if task is not None:
+        pool = await task
+        await pool.close()
+
+
+@lru_cache(maxsize=None)
+def load_query(filename: str) -> str:
+    """Load SQL query from file in the module directory.
+
+    Queries are read from disk only once.
+    """
+    with open(os.path.join(WORKING_DIR, filename), "r") as file:
+        return file.read()
 
 
 async def save_indicator_results(
@@ -63,13 +120,8 @@ async def save_indicator_results(
 
     logging.info("Save indicator result to database")
 
-    file_path = os.path.join(WORKING_DIR, "create_results_table.sql")
-    with open(file_path, "r") as file:
-        create_query = file.read()
-
-    file_path = os.path.join(WORKING_DIR, "save_results.sql")
-    with open(file_path, "r") as file:
-        upsert_query = file.read()
+    create_query = load_query("create_results_table.sql")
+    upsert_query = load_query("save_results.sql")
 
     data = (
         indicator.metadata.name,
@@ -88,6 +140,7 @@ async def save_indicator_results(
     async with get_connection() as conn:
         await conn.execute(create_query)
         await conn.execute(upsert_query, *data)
+    _RESULTS_CACHE.pop(data[:4], None)
 
 
 async def load_indicator_results(
@@ -101,6 +154,8 @@ async def load_indicator_results(
     Load indicators results from the Geodatabase.
     Writes retrieved results to the result attribute of the indicator object.
 
+    Results are cached in memory for a short time (config value `results_cache_ttl`).
+
     Returns:
         Indicator object
 
@@ -109,10 +164,6 @@ async def load_indicator_results(
     """
     logging.info("Load Indicator results from database")
 
-    file_path = os.path.join(WORKING_DIR, "load_results.sql")
-    with open(file_path, "r") as file:
-        query = file.read()
-
     query_data = (
         indicator.metadata.name,
         indicator.topic.name,
@@ -120,24 +171,43 @@ async def load_indicator_results(
         feature_id,
     )
 
-    async with get_connection() as conn:
-        query_result = await conn.fetchrow(query, *query_data)
-
-    if not query_result:
-        raise EmptyRecordError()
-
-    indicator.result.timestamp_oqt = query_result["timestamp_oqt"]
-    indicator.result.timestamp_osm = query_result["timestamp_osm"]
-    indicator.result.class_ = query_result["result_class"]
-    indicator.result.value = query_result["result_value"]
-    indicator.result.description = query_result["result_description"]
-    indicator.result.svg = query_result["result_svg"]
+    cached = _RESULTS_CACHE.get(query_data)
+    ttl = int(get_config_value("results_cache_ttl"))
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        _RESULTS_CACHE.move_to_end(query_data)
+        result = copy.deepcopy(cached[1])
+    else:
+        _RESULTS_CACHE.pop(query_data, None)
+        query = load_query("load_results.sql")
+        async with get_connection() as conn:
+            record = await conn.fetchrow(query, *query_data)
+        if not record:
+            raise EmptyRecordError()
+        # Keep only the result and its data. The feature geometry is not needed.
+        feature = geojson.loads(record["feature"])
+        result = {
+            "timestamp_oqt": record["timestamp_oqt"],
+            "timestamp_osm": record["timestamp_osm"],
+            "class_": record["result_class"],
+            "value": record["result_value"],
+            "description": record["result_description"],
+            "svg": record["result_svg"],
+            "data": feature["properties"].get("data", {}),
+        }
+        _RESULTS_CACHE[query_data] = (time.monotonic(), copy.deepcopy(result))
+        while len(_RESULTS_CACHE) > int(get_config_value("results_cache_size")):
+            _RESULTS_CACHE.popitem(last=False)
+
+    indicator.result.timestamp_oqt = result["timestamp_oqt"]
+    indicator.result.timestamp_osm = result["timestamp_osm"]
+    indicator.result.class_ = result["class_"]
+    indicator.result.value = result["value"]
+    indicator.result.description = result["description"]
+    indicator.result.svg = result["svg"]
 
     # Write data back to the attributes of the indicator object
-    feature = geojson.loads(query_result["feature"])
-    if "data" in feature["properties"]:
-        for key, value in feature["properties"]["data"].items():
-            setattr(indicator, key, value)
+    for key, value in result["data"].items():
+        setattr(indicator, key, value)
     return indicator
 
 
@@ -194,9 +264,7 @@ async def get_feature_from_db(dataset: str, feature_id: str) -> Feature:
 
 
 async def get_regions_as_geojson() -> FeatureCollection:
-    file_path = os.path.join(WORKING_DIR, "regions_as_geojson.sql")
-    with open(file_path, "r") as file:
-        query = file.read()
+    query = load_query("regions_as_geojson.sql")
     async with get_connection() as conn:
         record = await conn.fetchrow(query)
     feature_collection = geojson.loads(record[0])
@@ -228,15 +296,21 @@ def sanity_check_fid_field(dataset: str, fid_field: str) -> bool:
 
 
 async def type_of(table_name: str, column_name: str) -> str:
-    """Get data type of field"""
-    query = (
-        "SELECT data_type "
-        + "FROM information_schema.columns "
-        + "WHERE table_name = $1 AND column_name = $2"
-    )
-    async with get_connection() as conn:
-        record = await conn.fetchrow(query, table_name, column_name)
-    return record[0]
+    """Get data type of field.
+
+    Data types are cached since the schema of the datasets does not change.
+    """
+    key = (table_name, column_name)
+    if key not in _COLUMN_TYPES:
+        query = (
+            "SELECT data_type "
+            + "FROM information_schema.columns "
+            + "WHERE table_name = $1 AND column_name = $2"
+        )
+        async with get_connection() as conn:
+            record = await conn.fetchrow(query, table_name, column_name)
+        _COLUMN_TYPES[key] = record[0]
+    return _COLUMN_TYPES[key]
 
 
 async def map_fid_to_uid(dataset: str, feature_id: str, fid_field: str) -> str:
@@ -267,9 +341,7 @@ async def get_shdi(bpoly: Union[Feature, FeatureCollection]) -> List[Record]:
     If intersection with multiple GDL regions occurs, return the weighted average using
     the intersection area as the weight.
     """
-    file_path = os.path.join(WORKING_DIR, "select_shdi.sql")
-    with open(file_path, "r") as file:
-        query = file.read()
+    query = load_query("select_shdi.sql")
     if isinstance(bpoly, Feature):
         geom = [str(bpoly.geometry)]
     elif isinstance(bpoly, FeatureCollection):
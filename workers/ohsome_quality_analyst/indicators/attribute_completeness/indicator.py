@@ -2,7 +2,6 @@ import logging
 from io import StringIO
 from string import Template
 
-import dateutil.parser
 import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
 from geojson import Feature
@@ -30,7 +29,7 @@ class AttributeCompleteness(BaseIndicator):
         self.count_all = query_results_count["ratioResult"][0]["value"]
         self.count_match = query_results_count["ratioResult"][0]["value2"]
         timestamp = query_results_count["ratioResult"][0]["timestamp"]
-        self.result.timestamp_osm = dateutil.parser.isoparse(timestamp)
+        self.result.timestamp_osm = ohsome_client.parse_timestamp(timestamp)
 
     def calculate(self) -> None:
         # self.result.value (ratio) can be of type float, NaN if no features of filter1
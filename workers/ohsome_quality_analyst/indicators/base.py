@@ -4,10 +4,10 @@ import json
 from abc import ABCMeta, abstractmethod
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from io import StringIO
-from typing import Dict, Literal, Optional
+from typing import TYPE_CHECKING, Dict, Literal, Optional
 
-import matplotlib.pyplot as plt
 from geojson import Feature
 
 from ohsome_quality_analyst.definitions import get_attribution, get_metadata
@@ -18,8 +18,14 @@ from ohsome_quality_analyst.html_templates.template import (
 from ohsome_quality_analyst.topics.models import BaseTopic as Topic
 from ohsome_quality_analyst.utils.helper import flatten_dict, json_serialize
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
-@dataclass
+# Figures reused by the indicators to create their figure. One per indicator class.
+_FIGURES: Dict[str, "Figure"] = {}
+
+
+@dataclass(slots=True)
 class Metadata:
     """Metadata of an indicator as defined in the metadata.yaml file."""
 
@@ -29,7 +35,7 @@ class Metadata:
     result_description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     """The result of the Indicator.
 
@@ -183,24 +189,25 @@ class BaseIndicator(metaclass=ABCMeta):
 
     def _get_default_figure(self) -> str:
         """Return a SVG as default figure for indicators."""
-        px = 1 / plt.rcParams["figure.dpi"]  # Pixel in inches
-        figsize = (400 * px, 400 * px)
-        plt.figure(figsize=figsize)
-        plt.text(
-            5.5,
-            0.5,
-            "The creation of the Indicator was unsuccessful.",
-            bbox={"facecolor": "white", "alpha": 1, "edgecolor": "none", "pad": 1},
-            ha="center",
-            va="center",
-        )
-        plt.axvline(5.5, color="w", linestyle="solid")
-        plt.axis("off")
+        return get_default_figure()
+
+    def _get_figure(self, figsize: tuple) -> "Figure":
+        """Return an empty figure of given size to plot indicator results on.
 
-        svg_string = StringIO()
-        plt.savefig(svg_string, format="svg")
-        plt.close("all")
-        return svg_string.getvalue()
+        Creating a figure is costly. Therefore, a figure is created once for each
+        indicator class and cleared to be reused on subsequent calls. The figure is not
+        managed by `pyplot` and is not affected by `plt.close`.
+        """
+        from matplotlib.figure import Figure
+
+        fig = _FIGURES.get(type(self).__name__)
+        if fig is None:
+            fig = Figure(figsize=figsize)
+            _FIGURES[type(self).__name__] = fig
+        else:
+            fig.clear()
+            fig.set_size_inches(figsize)
+        return fig
 
     def create_html(self):
         if self.result.label == "red":
@@ -220,3 +227,33 @@ class BaseIndicator(metaclass=ABCMeta):
             indicator_description=self.metadata.description,
             traffic_light=traffic_light,
         )
+
+
+@lru_cache(maxsize=1)
+def get_default_figure() -> str:
+    """Return a SVG as default figure for indicators.
+
+    The default figure is the same for all indicators. Rendering it is costly and is
+    done only once.
+    """
+    # Import on first use to keep start-up time of the CLI and API low
+    import matplotlib.pyplot as plt
+
+    px = 1 / plt.rcParams["figure.dpi"]  # Pixel in inches
+    figsize = (400 * px, 400 * px)
+    plt.figure(figsize=figsize)
+    plt.text(
+        5.5,
+        0.5,
+        "The creation of the Indicator was unsuccessful.",
+        bbox={"facecolor": "white", "alpha": 1, "edgecolor": "none", "pad": 1},
+        ha="center",
+        va="center",
+    )
+    plt.axvline(5.5, color="w", linestyle="solid")
+    plt.axis("off")
+
+    svg_string = StringIO()
+    plt.savefig(svg_string, format="svg")
+    plt.close("all")
+    return svg_string.getvalue()
@@ -3,7 +3,6 @@ import os
 from io import StringIO
 from string import Template
 
-import dateutil.parser
 import geojson
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mtick
@@ -91,7 +90,7 @@ class BuildingCompleteness(BaseIndicator):
             group_by_boundary=True,
         )
         # Extract OSM data
-        self.result.timestamp_osm = dateutil.parser.isoparse(
+        self.result.timestamp_osm = ohsome_client.parse_timestamp(
             query_results["groupByResult"][0]["result"][0]["timestamp"]
         )
         self.building_area_osm = [
@@ -1,8 +1,8 @@
+import asyncio
 import logging
 from io import StringIO
 from string import Template
 
-import dateutil.parser
 import geojson
 import matplotlib.pyplot as plt
 
@@ -56,32 +56,39 @@ class Currentness(BaseIndicator):
             "{0}-01-01".format(latest_ohsome_stamp.year),
             self.end,
         )
-        # Fetch number of features
-        response = await ohsome_client.query(self.topic, self.feature)
+        # Serialize AOI only once for all queries
+        bpolys = ohsome_client.dumps_bpolys(self.feature)
+        # Fetch number of features, all contributions of past years and contributions
+        # of current year concurrently
+        (
+            response,
+            contributions_yearly,
+            contributions_current_year,
+        ) = await asyncio.gather(
+            ohsome_client.query(self.topic, bpolys),
+            ohsome_client.query(
+                self.topic,
+                bpolys,
+                time=past_years_interval,
+                count_latest_contributions=True,
+            ),
+            ohsome_client.query(
+                self.topic,
+                bpolys,
+                time=current_year_interval,
+                count_latest_contributions=True,
+            ),
+        )
         self.element_count = response["result"][0]["value"]
-        self.result.timestamp_osm = dateutil.parser.isoparse(
+        self.result.timestamp_osm = ohsome_client.parse_timestamp(
             response["result"][0]["timestamp"]
         )
-        # Fetch all contributions of past years
-        contributions_yearly = await ohsome_client.query(
-            self.topic,
-            self.feature,
-            time=past_years_interval,
-            count_latest_contributions=True,
-        )
-        # Fetch contributions of current year
-        contributions_current_year = await ohsome_client.query(
-            self.topic,
-            self.feature,
-            time=current_year_interval,
-            count_latest_contributions=True,
-        )
         # Merge contributions
         contributions = (
             contributions_yearly["result"] + contributions_current_year["result"]
         )
         for contrib in contributions:
-            time = dateutil.parser.isoparse(contrib["fromTimestamp"])
+            time = ohsome_client.parse_timestamp(contrib["fromTimestamp"])
             count = contrib["value"]
             self.contributions_abs[time.strftime("%Y")] = count
 
@@ -197,11 +204,12 @@ class Currentness(BaseIndicator):
         year_range = len(self.contributions_rel)
         last_edited_year = get_last_edited_year(self.contributions_abs)
         years_since_last_edit = int(self.result.timestamp_oqt.year) - last_edited_year
+        text_y = max(self.contributions_rel.values()) * 100 / 2
         for patch in patches:
             if year_range <= years_since_last_edit:
                 ax.text(
                     patch.get_x(),
-                    max(self.contributions_rel.values()) * 100 / 2,
+                    text_y,
                     "!",
                     fontdict={"fontsize": 26},
                 )
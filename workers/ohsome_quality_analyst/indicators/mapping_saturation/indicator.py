@@ -3,10 +3,7 @@ from io import StringIO
 from string import Template
 from typing import List, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
-import plotly.graph_objects as pgo
-from dateutil.parser import isoparse
 from geojson import Feature
 from rpy2.rinterface_lib.embedded import RRuntimeError
 
@@ -68,9 +65,11 @@ class MappingSaturation(BaseIndicator):
             self.feature,
             time=self.time_range,
         )
-        for item in query_results["result"]:
-            self.values.append(item["value"])
-            self.timestamps.append(isoparse(item["timestamp"]))
+        results = query_results["result"]
+        self.values = [item["value"] for item in results]
+        self.timestamps = [
+            ohsome_client.parse_timestamp(item["timestamp"]) for item in results
+        ]
 
     def calculate(self) -> None:
         # Latest timestamp of ohsome API results
@@ -80,7 +79,8 @@ class MappingSaturation(BaseIndicator):
             logging.info("Edge case is present. Skipping indicator calculation.")
             self.result.description = edge_case_description
             return
-        xdata = np.array(range(len(self.timestamps)))
+        xdata = np.arange(len(self.timestamps))
+        ydata = np.array(self.values)
         fitted_models = []
         for model in (
             models.Sigmoid,
@@ -92,7 +92,7 @@ class MappingSaturation(BaseIndicator):
         ):
             logging.info("Run {}".format(model.name))
             try:
-                fitted_models.append(model(xdata=xdata, ydata=np.array(self.values)))
+                fitted_models.append(model(xdata=xdata, ydata=ydata))
             # RRuntimeError can occur if data can not be modeled by the R model
             except RRuntimeError as error:
                 logging.info(
@@ -116,8 +116,9 @@ class MappingSaturation(BaseIndicator):
         self.best_fit = min(self.fitted_models, key=lambda m: m.mae)
         logging.info("Best fitting model: " + self.best_fit.name)
         # Saturation of the last 3 years of the fitted curve
-        y1 = np.interp(xdata[-36], xdata, self.best_fit.fitted_values)
-        y2 = np.interp(xdata[-1], xdata, self.best_fit.fitted_values)
+        # x values are the indices of the data points. No interpolation is needed.
+        y1 = self.best_fit.fitted_values[-36]
+        y2 = self.best_fit.fitted_values[-1]
         self.result.value = y1 / y2  # Saturation
         if 1.0 >= self.result.value > self.upper_threshold:
             self.result.class_ = 5
@@ -149,12 +150,14 @@ class MappingSaturation(BaseIndicator):
         )
 
     def create_figure(self) -> None:
+        import matplotlib.pyplot as plt
+
         if self.result.label == "undefined":
             logging.info("Result is undefined. Skipping figure creation.")
             return
         px = 1 / plt.rcParams["figure.dpi"]  # Pixel in inches
         figsize = (400 * px, 400 * px)
-        fig = plt.figure(figsize=figsize)
+        fig = self._get_figure(figsize)
         ax = fig.add_subplot()
         ax.set_title("Mapping Saturation")
         ax.plot(
@@ -171,11 +174,12 @@ class MappingSaturation(BaseIndicator):
         fig.subplots_adjust(bottom=0.3)
         fig.tight_layout()
         img_data = StringIO()
-        plt.savefig(img_data, format="svg", bbox_inches="tight")
+        fig.savefig(img_data, format="svg", bbox_inches="tight")
         self.result.svg = img_data.getvalue()
-        plt.close("all")
 
     def create_figure_plotly(self) -> None:
+        import plotly.graph_objects as pgo
+
         if self.result.label == "undefined":
             logging.info("Result is undefined. Skipping figure creation.")
             return
@@ -236,6 +240,7 @@ class MappingSaturation(BaseIndicator):
                     upper limit of the 95% confidence interval of the estimated
                     asymptote
         """
+        xdata_max = len(self.timestamps)
         for fm in list(fitted_models):
             if fm.name == "Nls Michaelis-Menten Model":
                 param = fm.coefficients["K"]
@@ -243,7 +248,6 @@ class MappingSaturation(BaseIndicator):
                 param = (fm.coefficients["asym"] + fm.coefficients["R0"]) / 2
             else:
                 param = fm.inflection_point
-            xdata_max = len(self.timestamps)
             if xdata_max <= param:
                 fitted_models.remove(fm)
 
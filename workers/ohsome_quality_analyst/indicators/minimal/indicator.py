@@ -1,7 +1,5 @@
 """An Indicator for testing purposes."""
-from string import Template
 
-import dateutil.parser
 from geojson import Feature
 
 from ohsome_quality_analyst.indicators.base import BaseIndicator
@@ -17,12 +15,12 @@ class Minimal(BaseIndicator):
     async def preprocess(self) -> None:
         query_results = await ohsome_client.query(self.topic, self.feature)
         self.count = query_results["result"][0]["value"]
-        self.result.timestamp_osm = dateutil.parser.isoparse(
+        self.result.timestamp_osm = ohsome_client.parse_timestamp(
             query_results["result"][0]["timestamp"]
         )
 
     def calculate(self) -> None:
-        description = Template(self.metadata.result_description).substitute()
+        description = self.metadata.result_description
         self.result.value = 1.0
         self.result.description = description + self.metadata.label_description["green"]
 
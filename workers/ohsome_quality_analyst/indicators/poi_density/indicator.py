@@ -1,9 +1,8 @@
+import asyncio
 import logging
 from io import StringIO
 from string import Template
 
-import dateutil.parser
-import matplotlib.pyplot as plt
 import numpy as np
 from geojson import Feature
 
@@ -31,11 +30,14 @@ class PoiDensity(BaseIndicator):
         return self.threshold_red * area
 
     async def preprocess(self) -> None:
-        query_results_count = await ohsome_client.query(self.topic, self.feature)
-        self.area_sqkm = await get_area_of_bpolys(self.feature.geometry)
+        # Query the ohsome API and the database concurrently
+        query_results_count, self.area_sqkm = await asyncio.gather(
+            ohsome_client.query(self.topic, self.feature),
+            get_area_of_bpolys(self.feature.geometry),
+        )
         self.count = query_results_count["result"][0]["value"]
         timestamp = query_results_count["result"][0]["timestamp"]
-        self.result.timestamp_osm = dateutil.parser.isoparse(timestamp)
+        self.result.timestamp_osm = ohsome_client.parse_timestamp(timestamp)
 
     def calculate(self) -> None:
         # TODO: we need to think about how we handle this
@@ -46,29 +48,24 @@ class PoiDensity(BaseIndicator):
         )
         if self.result.value >= self.threshold_yellow:
             self.result.class_ = 5
-            self.result.description = (
-                description + self.metadata.label_description["green"]
-            )
+        elif self.result.value > self.threshold_red:
+            self.result.class_ = 3
         else:
-            if self.result.value > self.threshold_red:
-                self.result.class_ = 3
-                self.result.description = (
-                    description + self.metadata.label_description["yellow"]
-                )
-            else:
-                self.result.class_ = 1
-                self.result.description = (
-                    description + self.metadata.label_description["red"]
-                )
+            self.result.class_ = 1
+        self.result.description = (
+            description + self.metadata.label_description[self.result.label]
+        )
 
     def create_figure(self) -> None:
+        import matplotlib.pyplot as plt
+
         if self.result.label == "undefined":
             logging.info("Result is undefined. Skipping figure creation.")
             return
 
         px = 1 / plt.rcParams["figure.dpi"]  # Pixel in inches
         figsize = (400 * px, 400 * px)
-        fig = plt.figure(figsize=figsize)
+        fig = self._get_figure(figsize)
         ax = fig.add_subplot()
 
         ax.set_title("POI Density (POIs per Area)")
@@ -83,8 +80,8 @@ class PoiDensity(BaseIndicator):
         x = np.linspace(0, max_area, 2)
 
         # Plot thresholds as line.
-        y1 = [self.green_threshold_function(xi) for xi in x]
-        y2 = [self.yellow_threshold_function(xi) for xi in x]
+        y1 = self.green_threshold_function(x)
+        y2 = self.yellow_threshold_function(x)
 
         line = ax.plot(
             x,
@@ -105,7 +102,7 @@ class PoiDensity(BaseIndicator):
         # Fill in space between thresholds
         ax.fill_between(x, y2, 0, alpha=0.5, color="red")
         ax.fill_between(x, y1, y2, alpha=0.5, color="yellow")
-        ax.fill_between(x, y1, max(max(y1), self.count), alpha=0.5, color="green")
+        ax.fill_between(x, y1, max(y1.max(), self.count), alpha=0.5, color="green")
 
         # Plot point as circle ("o").
         ax.plot(
@@ -119,6 +116,5 @@ class PoiDensity(BaseIndicator):
         ax.legend()
 
         img_data = StringIO()
-        plt.savefig(img_data, format="svg")
+        fig.savefig(img_data, format="svg")
         self.result.svg = img_data.getvalue()  # this is svg data
-        plt.close("all")
@@ -1,7 +1,9 @@
+import asyncio
 import datetime
 import json
 from functools import singledispatch
 from typing import Optional, Union
+from weakref import WeakKeyDictionary
 
 import geojson
 import httpx
@@ -20,6 +22,9 @@ from ohsome_quality_analyst.topics.models import BaseTopic as Topic
 from ohsome_quality_analyst.topics.models import TopicData, TopicDefinition
 from ohsome_quality_analyst.utils.exceptions import OhsomeApiError, TopicDataSchemaError
 
+# One HTTP client per event loop. Entries are removed once the event loop is gone.
+_CLIENTS: WeakKeyDictionary = WeakKeyDictionary()
+
 
 @singledispatch
 async def query(topic) -> dict:
@@ -32,7 +37,7 @@ async def query(topic) -> dict:
 @query.register
 async def _(
     topic: TopicDefinition,
-    bpolys: Union[Feature, FeatureCollection],
+    bpolys: Union[Feature, FeatureCollection, str],
     time: Optional[str] = None,
     ratio: Optional[bool] = False,
     group_by_boundary: Optional[bool] = False,
@@ -44,7 +49,8 @@ async def _(
         topic: Topic definition with ohsome API endpoint and parameters.
         bpolys: GeoJSON `Feature` for a single bounding (multi)polygon.
             `FeatureCollection` for "group by boundaries" queries. In this case the
-            argument `group_by` needs to be set to `True`.
+            argument `group_by` needs to be set to `True`. Can also be given as
+            serialized `FeatureCollection` (See `dumps_bpolys`).
         time: One or more ISO-8601 conform timestring(s) as accepted by the ohsome API.
         ratio: Ratio of OSM elements. The Topic definition needs to have
             a second filter defined.
@@ -101,8 +107,8 @@ async def query_ohsome_api(url: str, data: dict) -> dict:
     """
     headers = {"user-agent": get_config_value("user_agent")}
     # 660s timeout for reading, and a 300s timeout elsewhere.
-    async with httpx.AsyncClient(timeout=httpx.Timeout(300, read=660)) as client:
-        resp = await client.post(url, data=data, headers=headers)
+    timeout = httpx.Timeout(300, read=660)
+    resp = await get_client().post(url, data=data, headers=headers, timeout=timeout)
     try:
         resp.raise_for_status()
     except httpx.HTTPStatusError as error:
@@ -126,12 +132,49 @@ async def get_latest_ohsome_timestamp() -> datetime.datetime:
     """Get latest unix timestamp from the ohsome API."""
     url = get_config_value("ohsome_api").rstrip("/") + "/metadata"
     headers = {"user-agent": get_config_value("user_agent")}
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(url=url, headers=headers)
+    resp = await get_client().get(url=url, headers=headers)
     strtime = resp.json()["extractRegion"]["temporalExtent"]["toTimestamp"]
     return datetime.datetime.strptime(strtime, "%Y-%m-%dT%H:%MZ")
 
 
+def parse_timestamp(timestamp: str) -> datetime.datetime:
+    """Parse an ISO-8601 timestamp as returned by the ohsome API.
+
+    `datetime.fromisoformat` does not accept the suffix `Z` for UTC before Python 3.11.
+    Other ISO-8601 variants (e.g. of custom Topic data) are parsed by the slower
+    `isoparse` of `dateutil`.
+
+    Raises:
+        ValueError: If the timestamp is not a valid ISO-8601 string.
+    """
+    try:
+        return datetime.datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return isoparse(timestamp)
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the HTTP client of the running event loop.
+
+    The client is shared by all requests to the ohsome API within the same event loop.
+    This way connections are kept alive and reused instead of establishing a new
+    connection (and TLS session) for each request.
+    """
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient()
+        _CLIENTS[loop] = client
+    return client
+
+
+async def close_client() -> None:
+    """Close the HTTP client of the running event loop and its open connections."""
+    client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 def build_url(
     topic: Topic,
     ratio: bool = False,
@@ -152,22 +195,20 @@ def build_url(
 
 def build_data_dict(
     topic: Topic,
-    bpolys: Union[Feature, FeatureCollection],
+    bpolys: Union[Feature, FeatureCollection, str],
     time: Optional[str] = None,
     ratio: Optional[bool] = False,
 ) -> dict:
     """Build data dictionary for ohsome API query.
 
     Raises:
-        TypeError: If 'bpolys' is not of type Feature or FeatureCollection.
+        TypeError: If 'bpolys' is not of type Feature, FeatureCollection or str.
     """
     data = {"filter": topic.filter}
-    if isinstance(bpolys, Feature):
-        data["bpolys"] = json.dumps(FeatureCollection([bpolys]))
-    elif isinstance(bpolys, FeatureCollection):
-        data["bpolys"] = json.dumps(bpolys)
+    if isinstance(bpolys, str):
+        data["bpolys"] = bpolys
     else:
-        raise TypeError("Parameter 'bpolys' does not have expected type.")
+        data["bpolys"] = dumps_bpolys(bpolys)
     if time is not None:
         data["time"] = time
     if ratio:
@@ -175,6 +216,23 @@ def build_data_dict(
     return data
 
 
+def dumps_bpolys(bpolys: Union[Feature, FeatureCollection]) -> str:
+    """Serialize bounding polygons to a FeatureCollection as expected by the ohsome API.
+
+    Serialize once and pass the result to `query` to avoid serializing the same
+    bounding polygons for multiple queries.
+
+    Raises:
+        TypeError: If 'bpolys' is not of type Feature or FeatureCollection.
+    """
+    if isinstance(bpolys, Feature):
+        return json.dumps(FeatureCollection([bpolys]))
+    elif isinstance(bpolys, FeatureCollection):
+        return json.dumps(bpolys)
+    else:
+        raise TypeError("Parameter 'bpolys' does not have expected type.")
+
+
 def validate_query_results(
     response: dict,
     ratio: bool = False,
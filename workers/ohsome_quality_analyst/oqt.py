@@ -26,6 +26,7 @@ from ohsome_quality_analyst.definitions import (
     get_valid_topics,
 )
 from ohsome_quality_analyst.indicators.base import BaseIndicator as Indicator
+from ohsome_quality_analyst.ohsome import client as ohsome_client
 from ohsome_quality_analyst.reports.base import BaseReport as Report
 from ohsome_quality_analyst.topics.models import BaseTopic as Topic
 from ohsome_quality_analyst.utils.exceptions import (
@@ -184,11 +185,13 @@ async def _(
     except (UndefinedTableError, EmptyRecordError):
         failure = True
     if force or failure:
+        # The figure is saved to the database and needs to be created
         indicator = await create_indicator(
             IndicatorBpolys(
                 name=name,
                 topic=parameters.topic_key.value,
                 bpolys=feature,
+                include_svg=True,
             )
         )
         await db_client.save_indicator_results(indicator, dataset, feature_id)
@@ -218,8 +221,10 @@ async def _(
     await indicator.preprocess()
     logging.info("Run calculation")
     indicator.calculate()
-    logging.info("Run figure creation")
-    indicator.create_figure()
+    # Rendering the SVG figure is costly. Skip it if the figure is not requested.
+    if parameters.include_svg or parameters.include_html:
+        logging.info("Run figure creation")
+        indicator.create_figure()
     if hasattr(indicator, "create_figure_plotly"):
         indicator.create_figure_plotly()
     indicator.create_html()
@@ -249,8 +254,10 @@ async def _(
     await indicator.preprocess()
     logging.info("Run calculation")
     indicator.calculate()
-    logging.info("Run figure creation")
-    indicator.create_figure()
+    # Rendering the SVG figure is costly. Skip it if the figure is not requested.
+    if parameters.include_svg or parameters.include_html:
+        logging.info("Run figure creation")
+        indicator.create_figure()
     if hasattr(indicator, "create_figure_plotly"):
         indicator.create_figure_plotly()
     indicator.create_html()
@@ -342,6 +349,8 @@ async def _(parameters: ReportBpolys, *_args) -> Report:
                     name=indicator_name,
                     topic=topic_key,
                     bpolys=feature,
+                    include_svg=parameters.include_svg,
+                    include_html=parameters.include_html,
                 )
             )
         )
@@ -399,6 +408,16 @@ async def create_all_indicators(
         logging.warning("Ignoring error: {0}".format(message))
 
 
+async def close_connections() -> None:
+    """Close open connections of the running event loop.
+
+    Should be awaited before the event loop is closed, e.g. at the end of a CLI command
+    or on shutdown of the API.
+    """
+    await ohsome_client.close_client()
+    await db_client.close_pool()
+
+
 async def check_area_size(geom: Union[Polygon, MultiPolygon]):
     if await db_client.get_area_of_bpolys(geom) > get_config_value("geom_size_limit"):
         raise SizeRestrictionError(get_config_value("geom_size_limit"))
@@ -17,7 +17,7 @@ from ohsome_quality_analyst.indicators.base import BaseIndicator
 from ohsome_quality_analyst.utils.helper import flatten_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Metadata:
     """Metadata of a report as defined in the metadata.yaml file"""
 
@@ -26,7 +26,7 @@ class Metadata:
     label_description: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     """The result of the Report."""
 
@@ -107,31 +107,26 @@ class BaseReport(metaclass=ABCMeta):
         """Combine indicators results and create the report result object."""
         logging.info(f"Combine indicators for report: {self.metadata.name}")
 
+        classes = [i.result.class_ for i in self.indicators]
+        defined_classes = [c for c in classes if c is not None]
+
         if self.blocking_undefined:
-            if any(i.result.class_ is None for i in self.indicators):
+            if len(defined_classes) < len(classes):
                 self.result.class_ = None
                 self.result.description = self.metadata.label_description["undefined"]
                 return
 
         if self.blocking_red:
-            if any(i.result.class_ == 1 for i in self.indicators):
+            if 1 in defined_classes:
                 self.result.class_ = 1
                 self.result.description = self.metadata.label_description["red"]
                 return
 
-        if all(i.result.class_ is None for i in self.indicators):
+        if not defined_classes:
             self.result.class_ = None
             self.result.description = self.metadata.label_description["undefined"]
         else:
-            self.result.class_ = round(
-                np.mean(
-                    [
-                        i.result.class_
-                        for i in self.indicators
-                        if i.result.class_ is not None
-                    ]
-                )
-            )
+            self.result.class_ = round(np.mean(defined_classes))
 
         if self.result.class_ in (4, 5):
             self.result.description = self.metadata.label_description["green"]
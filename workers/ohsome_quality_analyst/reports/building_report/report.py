@@ -4,6 +4,13 @@ from ohsome_quality_analyst.reports.base import BaseReport, IndicatorTopic
 
 
 class BuildingReport(BaseReport):
+    _INDICATOR_TOPIC = (
+        IndicatorTopic("mapping-saturation", "building_count"),
+        IndicatorTopic("currentness", "building_count"),
+        IndicatorTopic("attribute-completeness", "building_count"),
+        IndicatorTopic("building-completeness", "building_area"),
+    )
+
     def __init__(
         self,
         feature: Feature,
@@ -11,12 +18,7 @@ class BuildingReport(BaseReport):
         blocking_undefined: bool = None,
     ):
         super().__init__(
-            indicator_topic=(
-                IndicatorTopic("mapping-saturation", "building_count"),
-                IndicatorTopic("currentness", "building_count"),
-                IndicatorTopic("attribute-completeness", "building_count"),
-                IndicatorTopic("building-completeness", "building_area"),
-            ),
+            indicator_topic=self._INDICATOR_TOPIC,
             feature=feature,
             blocking_red=blocking_red,
             blocking_undefined=blocking_undefined,
@@ -5,6 +5,25 @@ from ohsome_quality_analyst.reports.base import BaseReport, IndicatorTopic
 
 
 class FoodRelatedReport(BaseReport):
+    _INDICATOR_TOPIC = (
+        IndicatorTopic("mapping-saturation", "local_food_shops"),
+        IndicatorTopic("currentness", "local_food_shops"),
+        IndicatorTopic("mapping-saturation", "fast_food_restaurants"),
+        IndicatorTopic("currentness", "fast_food_restaurants"),
+        IndicatorTopic("Mapping-saturation", "restaurants"),
+        IndicatorTopic("currentness", "restaurants"),
+        IndicatorTopic("mapping-saturation", "supermarkets"),
+        IndicatorTopic("currentness", "supermarkets"),
+        IndicatorTopic("mapping-saturation", "convenience_stores"),
+        IndicatorTopic("currentness", "convenience_stores"),
+        IndicatorTopic("mapping-saturation", "pubs_and_biergartens"),
+        IndicatorTopic("currentness", "pubs_and_biergartens"),
+        IndicatorTopic("mapping-saturation", "alcohol_and_beverages"),
+        IndicatorTopic("currentness", "alcohol_and_beverages"),
+        IndicatorTopic("mapping-saturation", "sweets_and_pasteries"),
+        IndicatorTopic("currentness", "sweets_and_pasteries"),
+    )
+
     def __init__(
         self,
         feature: Feature,
@@ -12,24 +31,7 @@ class FoodRelatedReport(BaseReport):
         blocking_undefined: bool = True,
     ):
         super().__init__(
-            indicator_topic=(
-                IndicatorTopic("mapping-saturation", "local_food_shops"),
-                IndicatorTopic("currentness", "local_food_shops"),
-                IndicatorTopic("mapping-saturation", "fast_food_restaurants"),
-                IndicatorTopic("currentness", "fast_food_restaurants"),
-                IndicatorTopic("Mapping-saturation", "restaurants"),
-                IndicatorTopic("currentness", "restaurants"),
-                IndicatorTopic("mapping-saturation", "supermarkets"),
-                IndicatorTopic("currentness", "supermarkets"),
-                IndicatorTopic("mapping-saturation", "convenience_stores"),
-                IndicatorTopic("currentness", "convenience_stores"),
-                IndicatorTopic("mapping-saturation", "pubs_and_biergartens"),
-                IndicatorTopic("currentness", "pubs_and_biergartens"),
-                IndicatorTopic("mapping-saturation", "alcohol_and_beverages"),
-                IndicatorTopic("currentness", "alcohol_and_beverages"),
-                IndicatorTopic("mapping-saturation", "sweets_and_pasteries"),
-                IndicatorTopic("currentness", "sweets_and_pasteries"),
-            ),
+            indicator_topic=self._INDICATOR_TOPIC,
             feature=feature,
             blocking_red=blocking_red,
             blocking_undefined=blocking_undefined,
@@ -4,6 +4,19 @@ from ohsome_quality_analyst.reports.base import BaseReport, IndicatorTopic
 
 
 class MapActionPoc(BaseReport):
+    _INDICATOR_TOPIC = (
+        IndicatorTopic("mapping-saturation", "mapaction_settlements_count"),
+        IndicatorTopic("mapping-saturation", "mapaction_major_roads_length"),
+        IndicatorTopic("mapping-saturation", "mapaction_rail_length"),
+        IndicatorTopic("mapping-saturation", "mapaction_lakes_area"),
+        IndicatorTopic("mapping-saturation", "mapaction_rivers_length"),
+        IndicatorTopic("currentness", "mapaction_settlements_count"),
+        IndicatorTopic("currentness", "mapaction_major_roads_length"),
+        IndicatorTopic("currentness", "mapaction_rail_length"),
+        IndicatorTopic("currentness", "mapaction_lakes_count"),
+        IndicatorTopic("currentness", "mapaction_rivers_length"),
+    )
+
     def __init__(
         self,
         feature: Feature,
@@ -11,18 +24,7 @@ class MapActionPoc(BaseReport):
         blocking_undefined: bool = None,
     ):
         super().__init__(
-            indicator_topic=(
-                IndicatorTopic("mapping-saturation", "mapaction_settlements_count"),
-                IndicatorTopic("mapping-saturation", "mapaction_major_roads_length"),
-                IndicatorTopic("mapping-saturation", "mapaction_rail_length"),
-                IndicatorTopic("mapping-saturation", "mapaction_lakes_area"),
-                IndicatorTopic("mapping-saturation", "mapaction_rivers_length"),
-                IndicatorTopic("currentness", "mapaction_settlements_count"),
-                IndicatorTopic("currentness", "mapaction_major_roads_length"),
-                IndicatorTopic("currentness", "mapaction_rail_length"),
-                IndicatorTopic("currentness", "mapaction_lakes_count"),
-                IndicatorTopic("currentness", "mapaction_rivers_length"),
-            ),
+            indicator_topic=self._INDICATOR_TOPIC,
             feature=feature,
             blocking_red=blocking_red,
             blocking_undefined=blocking_undefined,
@@ -5,6 +5,11 @@ from ohsome_quality_analyst.reports.base import BaseReport, IndicatorTopic
 
 
 class Minimal(BaseReport):
+    _INDICATOR_TOPIC = (
+        IndicatorTopic("mapping-saturation", "building_count"),
+        IndicatorTopic("currentness", "building_count"),
+    )
+
     def __init__(
         self,
         feature: Feature,
@@ -12,10 +17,7 @@ class Minimal(BaseReport):
         blocking_undefined: bool = None,
     ):
         super().__init__(
-            indicator_topic=(
-                IndicatorTopic("mapping-saturation", "building_count"),
-                IndicatorTopic("currentness", "building_count"),
-            ),
+            indicator_topic=self._INDICATOR_TOPIC,
             feature=feature,
             blocking_red=blocking_red,
             blocking_undefined=blocking_undefined,
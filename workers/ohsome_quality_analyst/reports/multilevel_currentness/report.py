@@ -5,6 +5,13 @@ from ohsome_quality_analyst.reports.base import BaseReport, IndicatorTopic
 
 
 class MultilevelCurrentness(BaseReport):
+    _INDICATOR_TOPIC = (
+        IndicatorTopic("currentness", "infrastructure_lines"),
+        IndicatorTopic("currentness", "poi"),
+        IndicatorTopic("currentness", "lulc"),
+        IndicatorTopic("currentness", "building_count"),
+    )
+
     def __init__(
         self,
         feature: Feature,
@@ -12,12 +19,7 @@ class MultilevelCurrentness(BaseReport):
         blocking_undefined: bool = None,
     ):
         super().__init__(
-            indicator_topic=(
-                IndicatorTopic("currentness", "infrastructure_lines"),
-                IndicatorTopic("currentness", "poi"),
-                IndicatorTopic("currentness", "lulc"),
-                IndicatorTopic("currentness", "building_count"),
-            ),
+            indicator_topic=self._INDICATOR_TOPIC,
             feature=feature,
             blocking_red=blocking_red,
             blocking_undefined=blocking_undefined,
@@ -5,6 +5,13 @@ from ohsome_quality_analyst.reports.base import BaseReport, IndicatorTopic
 
 
 class MultilevelMappingSaturation(BaseReport):
+    _INDICATOR_TOPIC = (
+        IndicatorTopic("mapping-saturation", "infrastructure_lines"),
+        IndicatorTopic("mapping-saturation", "poi"),
+        IndicatorTopic("mapping-saturation", "lulc"),
+        IndicatorTopic("mapping-saturation", "building_count"),
+    )
+
     def __init__(
         self,
         feature: Feature,
@@ -12,12 +19,7 @@ class MultilevelMappingSaturation(BaseReport):
         blocking_undefined: bool = None,
     ):
         super().__init__(
-            indicator_topic=(
-                IndicatorTopic("mapping-saturation", "infrastructure_lines"),
-                IndicatorTopic("mapping-saturation", "poi"),
-                IndicatorTopic("mapping-saturation", "lulc"),
-                IndicatorTopic("mapping-saturation", "building_count"),
-            ),
+            indicator_topic=self._INDICATOR_TOPIC,
             feature=feature,
             blocking_red=blocking_red,
             blocking_undefined=blocking_undefined,
@@ -5,6 +5,12 @@ from ohsome_quality_analyst.reports.base import BaseReport, IndicatorTopic
 
 
 class RoadReport(BaseReport):
+    _INDICATOR_TOPIC = (
+        IndicatorTopic("mapping-saturation", "major_roads_length"),
+        IndicatorTopic("currentness", "major_roads_count"),
+        IndicatorTopic("attribute-completeness", "major_roads_length"),
+    )
+
     def __init__(
         self,
         feature: Feature,
@@ -12,11 +18,7 @@ class RoadReport(BaseReport):
         blocking_undefined: bool = None,
     ):
         super().__init__(
-            indicator_topic=(
-                IndicatorTopic("mapping-saturation", "major_roads_length"),
-                IndicatorTopic("currentness", "major_roads_count"),
-                IndicatorTopic("attribute-completeness", "major_roads_length"),
-            ),
+            indicator_topic=self._INDICATOR_TOPIC,
             feature=feature,
             blocking_red=blocking_red,
             blocking_undefined=blocking_undefined,
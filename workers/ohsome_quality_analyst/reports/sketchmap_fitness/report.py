@@ -4,6 +4,13 @@ from ohsome_quality_analyst.reports.base import BaseReport, IndicatorTopic
 
 
 class SketchmapFitness(BaseReport):
+    _INDICATOR_TOPIC = (
+        IndicatorTopic("mapping-saturation", "major_roads_length"),
+        IndicatorTopic("currentness", "major_roads_count"),
+        IndicatorTopic("currentness", "amenities"),
+        IndicatorTopic("poi-density", "poi"),
+    )
+
     def __init__(
         self,
         feature: Feature,
@@ -11,12 +18,7 @@ class SketchmapFitness(BaseReport):
         blocking_undefined: bool = None,
     ):
         super().__init__(
-            indicator_topic=(
-                IndicatorTopic("mapping-saturation", "major_roads_length"),
-                IndicatorTopic("currentness", "major_roads_count"),
-                IndicatorTopic("currentness", "amenities"),
-                IndicatorTopic("poi-density", "poi"),
-            ),
+            indicator_topic=self._INDICATOR_TOPIC,
             feature=feature,
             blocking_red=blocking_red,
             blocking_undefined=blocking_undefined,
@@ -7,6 +7,7 @@ import os
 import pkgutil
 import re
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Generator, Union
 
@@ -17,9 +18,13 @@ from geojson import Feature, FeatureCollection, MultiPolygon, Polygon
 from ohsome_quality_analyst.indicators.mapping_saturation.models import BaseStatModel
 
 
+@lru_cache(maxsize=None)
 def name_to_class(class_type: str, name: str):
     """Convert class name of class type (indicator or report) to the class.
 
+    The result is cached. The class is looked up only once per name instead of once
+    per created indicator or report.
+
     Assumptions:
     - Class is named in Camel Case (E.g. MappingSaturation).
     - Path to the module is in Snake Case (E.g. indicators.mapping_saturation.indicator)
@@ -61,8 +66,7 @@ def hyphen_to_snake(hyphen: str):
 
 def snake_to_hyphen(snake: str) -> str:
     """Converts Snake Case to Lower Hyphen Case"""
-    parts = snake.split("_")
-    return "-".join(parts)
+    return snake.replace("_", "-")
 
 
 def get_module_dir(module_name: str) -> str:
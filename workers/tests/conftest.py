@@ -10,12 +10,12 @@ from ohsome_quality_analyst.topics.models import BaseTopic as Topic
 FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def topic_building_count() -> Topic:
     return get_topic_definition("building_count")
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def feature_germany_heidelberg() -> Feature:
     path = os.path.join(
         FIXTURE_DIR,
@@ -25,7 +25,7 @@ def feature_germany_heidelberg() -> Feature:
         return geojson.load(f)
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def feature_collection_germany_heidelberg_bahnstadt_bergheim() -> FeatureCollection:
     path = os.path.join(
         FIXTURE_DIR,
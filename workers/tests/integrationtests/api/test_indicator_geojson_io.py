@@ -21,12 +21,15 @@ from tests.unittests.mapping_saturation.fixtures import VALUES_1 as DATA
 
 
 class TestApiIndicatorIo(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.feature = get_geojson_fixture("heidelberg-altstadt-feature.geojson")
+
     def setUp(self):
         self.client = TestClient(app)
         self.endpoint = "/indicator"
         self.indicator_name = "minimal"
         self.topic_key = "minimal"
-        self.feature = get_geojson_fixture("heidelberg-altstadt-feature.geojson")
 
         self.general_schema = get_general_schema()
         self.feature_schema = get_indicator_feature_schema()
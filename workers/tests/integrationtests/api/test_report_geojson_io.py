@@ -17,12 +17,15 @@ from tests.integrationtests.utils import get_geojson_fixture, oqt_vcr
 
 
 class TestApiReportIo(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.feature = get_geojson_fixture("heidelberg-altstadt-feature.geojson")
+
     def setUp(self):
         self.client = TestClient(app)
         self.endpoint = "/report"
 
         self.report_name = "minimal"
-        self.feature = get_geojson_fixture("heidelberg-altstadt-feature.geojson")
         self.dataset = "regions"
         self.feature_id = 3  # Heidelberg
         self.fid_field = "ogc_fid"
@@ -16,7 +16,7 @@ async def get_connection_context_manager():
 class TestPostgres(unittest.TestCase):
     def test_connection(self):
         instance_type = asyncio.run(get_connection_context_manager())
-        self.assertEqual(instance_type, asyncpg.connection.Connection)
+        self.assertEqual(instance_type, asyncpg.pool.PoolConnectionProxy)
 
     @mock.patch(
         "ohsome_quality_analyst.config.get_config",
@@ -32,6 +32,13 @@ class TestCliUnit(unittest.TestCase):
         result = self.runner.invoke(cli, ["list-indicators"])
         assert result.exit_code == 0
 
+    def test_list_indicators_logging_order(self):
+        result = self.runner.invoke(cli, ["list-indicators"])
+        assert result.exit_code == 0
+        assert "Logging enabled" in result.output
+        # Log records are written before the output of the command
+        assert result.output.index("Logging enabled") < result.output.index("Minimal")
+
     def test_list_reports(self):
         result = self.runner.invoke(cli, ["list-reports"])
         assert result.exit_code == 0
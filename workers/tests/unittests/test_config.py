@@ -19,6 +19,8 @@ class TestConfig(unittest.TestCase):
             "log_level",
             "ohsome_api",
             "concurrent_computations",
+            "results_cache_size",
+            "results_cache_ttl",
             "user_agent",
             "datasets",
         }
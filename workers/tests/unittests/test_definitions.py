@@ -1,3 +1,4 @@
+import os
 import unittest
 
 import pytest
@@ -97,3 +98,21 @@ def test_get_topic_definitions_not_found_error():
         definitions.get_topic_definition("foo")
     with pytest.raises(KeyError):
         definitions.get_topic_definition(None)
+
+
+def test_load_yaml_cached(tmp_path):
+    file = tmp_path / "metadata.yaml"
+    file.write_text("foo: bar\n")
+    content = definitions.load_yaml(str(file))
+    assert content == {"foo": "bar"}
+    assert definitions.load_yaml(str(file)) is content
+
+
+def test_load_yaml_modified(tmp_path):
+    file = tmp_path / "metadata.yaml"
+    file.write_text("foo: bar\n")
+    definitions.load_yaml(str(file))
+    file.write_text("foo: baz\n")
+    stat = file.stat()
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert definitions.load_yaml(str(file)) == {"foo": "baz"}
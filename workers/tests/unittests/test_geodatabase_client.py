@@ -0,0 +1,166 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest import TestCase, mock
+
+from ohsome_quality_analyst.geodatabase import client as db_client
+from ohsome_quality_analyst.utils.exceptions import EmptyRecordError
+
+
+def get_record(value: float = 0.5) -> dict:
+    return {
+        "timestamp_oqt": "2023-01-01T00:00:00",
+        "timestamp_osm": "2023-01-01T00:00:00",
+        "result_class": 3,
+        "result_value": value,
+        "result_description": "",
+        "result_svg": "",
+        "feature": json.dumps(
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [8.7, 49.4]},
+                "properties": {"data": {"values": [1, 2, 3]}},
+            }
+        ),
+    }
+
+
+def get_indicator(name: str = "minimal") -> SimpleNamespace:
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name),
+        topic=SimpleNamespace(name="minimal"),
+        result=SimpleNamespace(
+            timestamp_oqt=None,
+            timestamp_osm=None,
+            class_=None,
+            value=None,
+            description=None,
+            svg=None,
+        ),
+        as_feature=lambda **_kwargs: {},
+    )
+
+
+class TestResultsCache(TestCase):
+    def setUp(self):
+        db_client._RESULTS_CACHE.clear()
+        self.conn = mock.MagicMock()
+        self.conn.fetchrow = mock.AsyncMock(return_value=get_record())
+        self.conn.execute = mock.AsyncMock()
+
+        @asynccontextmanager
+        async def get_connection():
+            yield self.conn
+
+        patcher = mock.patch.object(db_client, "get_connection", get_connection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(db_client._RESULTS_CACHE.clear)
+
+        self.config = {"results_cache_size": 256, "results_cache_ttl": 60}
+        patcher = mock.patch.object(
+            db_client, "get_config_value", lambda key: self.config[key]
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def load(self, indicator=None, feature_id="1"):
+        return asyncio.run(
+            db_client.load_indicator_results(
+                indicator or get_indicator(), "regions", feature_id
+            )
+        )
+
+    def test_cache_hit(self):
+        self.load()
+        indicator = self.load()
+        self.assertEqual(self.conn.fetchrow.call_count, 1)
+        self.assertEqual(indicator.result.value, 0.5)
+        self.assertEqual(indicator.values, [1, 2, 3])
+
+    def test_cache_content(self):
+        self.load()
+        _, result = db_client._RESULTS_CACHE[("minimal", "minimal", "regions", "1")]
+        # Feature with geometry is not kept in memory
+        self.assertNotIn("feature", result)
+        self.assertEqual(result["data"], {"values": [1, 2, 3]})
+
+    def test_cache_expired(self):
+        self.load()
+        self.config["results_cache_ttl"] = 0
+        self.load()
+        self.assertEqual(self.conn.fetchrow.call_count, 2)
+
+    def test_cache_stores_copy(self):
+        indicator = self.load()
+        indicator.values.append(4)
+        indicator = self.load()
+        self.assertEqual(indicator.values, [1, 2, 3])
+
+    def test_cache_eviction(self):
+        self.config["results_cache_size"] = 2
+        for feature_id in ("1", "2", "3"):
+            self.load(feature_id=feature_id)
+        self.assertEqual(len(db_client._RESULTS_CACHE), 2)
+        # Least recently used entry has been evicted
+        self.load(feature_id="1")
+        self.assertEqual(self.conn.fetchrow.call_count, 4)
+
+    def test_cache_disabled(self):
+        self.config["results_cache_size"] = 0
+        self.load()
+        self.assertEqual(len(db_client._RESULTS_CACHE), 0)
+
+    def test_cache_removal_on_save(self):
+        indicator = self.load()
+        asyncio.run(db_client.save_indicator_results(indicator, "regions", "1"))
+        self.assertEqual(len(db_client._RESULTS_CACHE), 0)
+        self.load()
+        self.assertEqual(self.conn.fetchrow.call_count, 2)
+
+    def test_empty_record(self):
+        self.conn.fetchrow.return_value = None
+        with self.assertRaises(EmptyRecordError):
+            self.load()
+        self.assertEqual(len(db_client._RESULTS_CACHE), 0)
+
+
+class TestPool(TestCase):
+    def setUp(self):
+        db_client._POOLS.clear()
+        self.addCleanup(db_client._POOLS.clear)
+        self.pool = mock.MagicMock()
+        self.pool.close = mock.AsyncMock()
+        patcher = mock.patch.object(
+            db_client.asyncpg, "create_pool", mock.AsyncMock(return_value=self.pool)
+        )
+        self.create_pool = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_pool_same_loop(self):
+        async def get_pools():
+            return await db_client.get_pool(), await db_client.get_pool()
+
+        pool_1, pool_2 = asyncio.run(get_pools())
+        self.assertIs(pool_1, pool_2)
+        self.assertEqual(self.create_pool.call_count, 1)
+
+    def test_close_pool(self):
+        async def close():
+            await db_client.get_pool()
+            await db_client.close_pool()
+
+        asyncio.run(close())
+        self.pool.close.assert_awaited_once()
+        self.assertEqual(len(db_client._POOLS), 0)
+
+    def test_close_pool_without_pool(self):
+        # Should not raise
+        asyncio.run(db_client.close_pool())
+
+    def test_terminate_pool_of_closed_loop(self):
+        asyncio.run(db_client.get_pool())
+        asyncio.run(db_client.get_pool())
+        self.pool.terminate.assert_called_once()
+        self.assertEqual(len(db_client._POOLS), 1)
@@ -2,6 +2,7 @@ import logging
 import os
 import sys
 import unittest
+from logging.handlers import QueueHandler
 
 from ohsome_quality_analyst.config import configure_logging
 
@@ -38,6 +39,19 @@ class TestLogging(unittest.TestCase):
         configure_logging()
         self.assertEqual(getattr(logging, "DEBUG"), logging.root.level)
 
+    def test_queue_handler(self):
+        configure_logging(use_queue=True)
+        configure_logging(use_queue=True)
+        self.assertEqual(len(logging.root.handlers), 1)
+        self.assertIsInstance(logging.root.handlers[0], QueueHandler)
+        configure_logging()
+
+    def test_no_queue_handler(self):
+        configure_logging(use_queue=True)
+        configure_logging()
+        self.assertEqual(len(logging.root.handlers), 1)
+        self.assertNotIsInstance(logging.root.handlers[0], QueueHandler)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 import asyncio
+import datetime
 import os
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
@@ -255,6 +256,14 @@ class TestOhsomeClientBuildData(TestCase):
         with self.assertRaises(TypeError):
             ohsome_client.build_data_dict(self.topic, bpolys)
 
+    def test_serialized(self) -> None:
+        bpolys = ohsome_client.dumps_bpolys(self.bpolys)
+        data = ohsome_client.build_data_dict(self.topic, bpolys)
+        self.assertEqual(
+            data["bpolys"],
+            ohsome_client.build_data_dict(self.topic, self.bpolys)["bpolys"],
+        )
+
     def test_time(self) -> None:
         schema = Schema(
             {
@@ -482,3 +491,77 @@ class TestOhsomeClientValidateQuery(TestCase):
                 ratio=True,
                 group_by_boundary=True,
             )
+
+
+class TestOhsomeClientHttpClient(TestCase):
+    def test_get_client_same_loop(self):
+        async def get_clients():
+            return ohsome_client.get_client(), ohsome_client.get_client()
+
+        client_1, client_2 = asyncio.run(get_clients())
+        self.assertIs(client_1, client_2)
+
+    def test_close_client(self):
+        async def close():
+            client = ohsome_client.get_client()
+            await ohsome_client.close_client()
+            return client, ohsome_client.get_client()
+
+        closed, new = asyncio.run(close())
+        self.assertTrue(closed.is_closed)
+        self.assertIsNot(closed, new)
+        self.assertFalse(new.is_closed)
+
+    def test_close_client_without_client(self):
+        # Should not raise
+        asyncio.run(ohsome_client.close_client())
+
+
+class TestOhsomeClientParseTimestamp(TestCase):
+    def test_utc_suffix(self):
+        self.assertEqual(
+            ohsome_client.parse_timestamp("2020-03-20T01:30:08Z"),
+            datetime.datetime(2020, 3, 20, 1, 30, 8, tzinfo=datetime.timezone.utc),
+        )
+
+    def test_utc_suffix_minutes(self):
+        self.assertEqual(
+            ohsome_client.parse_timestamp("2023-03-26T20:00Z"),
+            datetime.datetime(2023, 3, 26, 20, 0, tzinfo=datetime.timezone.utc),
+        )
+
+    def test_utc_suffix_fraction(self):
+        self.assertEqual(
+            ohsome_client.parse_timestamp("2020-03-20T01:30:08.180Z"),
+            datetime.datetime(
+                2020, 3, 20, 1, 30, 8, 180000, tzinfo=datetime.timezone.utc
+            ),
+        )
+
+    def test_offset(self):
+        self.assertEqual(
+            ohsome_client.parse_timestamp("2020-03-20T01:30:08+00:00"),
+            datetime.datetime(2020, 3, 20, 1, 30, 8, tzinfo=datetime.timezone.utc),
+        )
+
+    def test_naive(self):
+        timestamp = ohsome_client.parse_timestamp("2020-03-20T01:30:08.180856")
+        self.assertEqual(timestamp, datetime.datetime(2020, 3, 20, 1, 30, 8, 180856))
+        self.assertIsNone(timestamp.tzinfo)
+
+    def test_date(self):
+        self.assertEqual(
+            ohsome_client.parse_timestamp("2020-03-20"),
+            datetime.datetime(2020, 3, 20),
+        )
+
+    def test_reduced_precision(self):
+        # Not supported by `datetime.fromisoformat`
+        self.assertEqual(
+            ohsome_client.parse_timestamp("2020-03"),
+            datetime.datetime(2020, 3, 1),
+        )
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            ohsome_client.parse_timestamp("20th of March 2020")
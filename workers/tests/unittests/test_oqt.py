@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from ohsome_quality_analyst import oqt
+from ohsome_quality_analyst.api.request_models import IndicatorBpolys, IndicatorDatabase
+from ohsome_quality_analyst.utils.exceptions import EmptyRecordError
+
+from .utils import get_geojson_fixture
+
+
+class TestOqtCreateFigure(unittest.TestCase):
+    def setUp(self):
+        self.feature = get_geojson_fixture("heidelberg-altstadt-feature.geojson")
+        self.indicator = mock.MagicMock()
+        self.indicator.preprocess = mock.AsyncMock()
+        patcher = mock.patch.object(
+            oqt, "name_to_class", return_value=mock.Mock(return_value=self.indicator)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_indicator(self, **kwargs):
+        parameters = IndicatorBpolys(
+            name="minimal", topic="minimal", bpolys=self.feature, **kwargs
+        )
+        return asyncio.run(oqt.create_indicator(parameters))
+
+    def test_skip_figure(self):
+        self.create_indicator()
+        self.indicator.create_figure.assert_not_called()
+        self.indicator.create_html.assert_called_once()
+
+    def test_include_svg(self):
+        self.create_indicator(include_svg=True)
+        self.indicator.create_figure.assert_called_once()
+
+    def test_include_html(self):
+        self.create_indicator(include_html=True)
+        self.indicator.create_figure.assert_called_once()
+
+    @mock.patch.object(oqt.db_client, "save_indicator_results", mock.AsyncMock())
+    @mock.patch.object(
+        oqt.db_client,
+        "load_indicator_results",
+        mock.AsyncMock(side_effect=EmptyRecordError()),
+    )
+    def test_database_fallback(self):
+        # The figure is saved to the database and always needs to be created
+        with mock.patch.object(
+            oqt.db_client,
+            "get_feature_from_db",
+            mock.AsyncMock(return_value=self.feature),
+        ):
+            parameters = IndicatorDatabase(
+                name="minimal", topic="minimal", dataset="regions", feature_id="3"
+            )
+            asyncio.run(oqt.create_indicator(parameters))
+        self.indicator.create_figure.assert_called_once()
+        oqt.db_client.save_indicator_results.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()